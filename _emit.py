@@ -0,0 +1,138 @@
+"""
+Shared index output helpers.
+
+Used by the index generator scripts to check a generated index against the
+existing file and, only when its content changed, stream it into a
+temporary file next to the target and move it into place.
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+from datetime import datetime
+
+
+# Start of the timestamp line written at the top of the index
+GENERATED_PREFIX = "*Generated on: "
+
+
+class _DigestingWriter:
+    """Text stream that only hashes what is written to it."""
+    
+    def __init__(self):
+        self._digest = hashlib.sha256()
+    
+    def write(self, text):
+        self._digest.update(text.encode("utf-8"))
+        return len(text)
+    
+    def digest(self):
+        return self._digest.digest()
+
+
+def content_digest(lines):
+    """
+    Compute a SHA-256 digest of index lines, ignoring the generation timestamp.
+    
+    Args:
+        lines: Iterable of lines making up the index
+    
+    Returns:
+        Bytes digest of the content
+    """
+    digest = hashlib.sha256()
+    for line in lines:
+        # The timestamp changes on every run, so it must not affect the digest
+        if not line.startswith(GENERATED_PREFIX):
+            digest.update(line.encode("utf-8"))
+    return digest.digest()
+
+
+def file_digest(path):
+    """
+    Compute the content digest of an existing index file.
+    
+    Args:
+        path: Path of the index file
+    
+    Returns:
+        Bytes digest of the content, or None if the file cannot be read
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return content_digest(f)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _index_mode(index_path):
+    """
+    Get the permission bits to give a rewritten index.
+    
+    Args:
+        index_path: Path of the index file
+    
+    Returns:
+        The existing file's mode, or the default for a new file under the
+        current umask
+    """
+    try:
+        return stat.S_IMODE(os.stat(index_path).st_mode)
+    except FileNotFoundError:
+        # os.umask() can only be read by setting it, so restore it right away
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def emit_index(index_path, title, emit_body):
+    """
+    Stream an index to disk, replacing the existing file only if it changed.
+    
+    The header (title and timestamp) is written here; emit_body writes the
+    rest. The body is first emitted into a hashing sink and compared with
+    the existing index, so an unchanged index opens nothing for writing.
+    Otherwise it is emitted again into a uniquely named temporary file next
+    to the index, which is atomically moved into place.
+    
+    Args:
+        index_path: Path of the index file
+        title: Title used for the top-level heading
+        emit_body: Callable taking a writable text stream for the index body;
+            called twice when the index changed, so it must be repeatable
+    
+    Returns:
+        True if the index was written, False if it was already up to date
+    """
+    # Hash everything except the timestamp line, matching content_digest()
+    sink = _DigestingWriter()
+    sink.write(f"# {title}\n\n")
+    sink.write("\n")
+    emit_body(sink)
+    
+    if sink.digest() == file_digest(index_path):
+        return False
+    
+    index_dir, index_name = os.path.split(os.path.abspath(index_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{index_name}.", suffix=".tmp", dir=index_dir)
+    
+    try:
+        with open(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(f"# {title}\n\n")
+            f.write(f"{GENERATED_PREFIX}{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+            emit_body(f)
+        
+        # mkstemp creates the file private to the owner; keep the mode an
+        # existing index had, or what open() would give a new one
+        os.chmod(tmp_path, _index_mode(index_path))
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        # Don't leave a stray temporary file behind
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    return True
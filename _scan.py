@@ -0,0 +1,100 @@
+"""
+Shared directory scanning helpers.
+
+Used by the index generator scripts to walk a directory tree for files with
+fixed suffixes. Directory listings come from os.scandir, so file types are
+read from the listing itself instead of separate stat calls, and ignored
+directories are never descended into.
+"""
+
+import os
+
+
+# Directory names that are never descended into by default
+DEFAULT_IGNORED = frozenset({'.git', '__pycache__', '.venv', 'node_modules'})
+
+
+def _is_file(entry):
+    """
+    Check whether a directory entry is a file, following symlinks.
+    
+    Args:
+        entry: os.DirEntry to check
+    
+    Returns:
+        bool: True if the entry is a file; False if it is not or cannot be checked
+    """
+    try:
+        return entry.is_file()
+    except OSError:
+        # e.g. a symlink into a directory that cannot be searched
+        return False
+
+
+def _list_directory(dir_path, rel_dir, ignored, suffixes, skip_hidden):
+    """
+    List a single directory for matching files and subdirectories.
+    
+    Args:
+        dir_path: Absolute path of the directory
+        rel_dir: Directory path relative to the scan root ("" for the root)
+        ignored: Names of entries to skip
+        suffixes: Tuple of file name suffixes to match
+        skip_hidden: Whether to skip entries whose name starts with a dot
+    
+    Returns:
+        tuple: (rel_dir, sorted list of matching file names,
+        list of (dir_path, rel_dir) subdirectories to visit)
+    """
+    try:
+        # Materialize the listing once so both passes below reuse it
+        with os.scandir(dir_path) as it:
+            entries = [
+                entry for entry in it
+                if entry.name not in ignored and not (skip_hidden and entry.name.startswith('.'))
+            ]
+    except OSError:
+        # Skip directories that cannot be read
+        return rel_dir, [], []
+    
+    # is_dir()/is_file() are answered from the directory listing, no extra stat
+    subdirs = [
+        (entry.path, os.path.join(rel_dir, entry.name))
+        for entry in entries
+        if entry.is_dir(follow_symlinks=False)
+    ]
+    
+    # Sorted by lowercased name, with the original name breaking ties
+    names = sorted(
+        (entry.name for entry in entries if entry.name.endswith(suffixes) and _is_file(entry)),
+        key=lambda name: (name.lower(), name),
+    )
+    
+    return rel_dir, names, subdirs
+
+
+def walk_markdown(root, *, ignored=DEFAULT_IGNORED, suffixes=('.md',), skip_hidden=False):
+    """
+    Walk a directory tree for files ending with one of the given suffixes.
+    
+    Files of one directory are yielded together, ordered by case-insensitive
+    name.
+    
+    Args:
+        root: Path of the directory to walk
+        ignored: Names of files and directories to skip
+        suffixes: Tuple of file name suffixes to match
+        skip_hidden: Whether to skip files and directories whose name starts with a dot
+    
+    Yields:
+        tuple: (relative directory, file name) for each matching file; the
+        relative directory is "" for the root
+    """
+    # Stack of (directory, relative directory) pairs still to visit
+    stack = [(root, '')]
+    
+    while stack:
+        rel_dir, names, subdirs = _list_directory(*stack.pop(), ignored, suffixes, skip_hidden)
+        stack.extend(subdirs)
+        for name in names:
+            yield rel_dir, name
@@ -11,12 +11,20 @@ Usage:
 If no directory is specified, it uses the current directory.
 """
 
+import functools
 import os
+import stat
 import sys
-from pathlib import Path
-from datetime import datetime
 from collections import defaultdict
 
+from _emit import emit_index
+from _scan import walk_markdown
+
+
+# Maps a lowercased directory name to its markdown heading anchor; both path
+# separators become dashes so Windows paths get the same anchors
+_SLUG_TABLE = str.maketrans({' ': '-', '/': '-', '\\': '-', '.': None})
+
 
 def scan_markdown_files(root_dir):
     """
@@ -26,95 +34,53 @@ def scan_markdown_files(root_dir):
         root_dir: Root directory to start scanning from
         
     Returns:
-        Dictionary with directory paths as keys and lists of markdown files as values
+        Dictionary with directory paths as keys and lists of
+        (display_name, link_path) tuples, sorted by file name, as values
     """
     md_files = defaultdict(list)
-    root_path = Path(root_dir).resolve()
+    root_path = os.path.realpath(root_dir)
     
-    for md_file in root_path.rglob("*.md"):
+    for rel_dir, name in walk_markdown(root_path):
         # Skip the index.md file itself
-        if md_file.name.lower() == "index.md":
-            continue
-            
-        # Get relative path from root
-        try:
-            rel_path = md_file.relative_to(root_path)
-            parent_dir = str(rel_path.parent) if str(rel_path.parent) != "." else "Root"
-            md_files[parent_dir].append(md_file)
-        except ValueError:
-            # Skip files outside root directory
+        if name.lower() == "index.md":
             continue
+        # Obsidian links use the relative path without extension
+        stem = name[:-3]
+        md_files[rel_dir or "Root"].append((stem, os.path.join(rel_dir, stem)))
     
     return md_files
 
 
-def create_obsidian_link(file_path, root_path):
-    """
-    Create an Obsidian-compatible link for a markdown file.
-    
-    Args:
-        file_path: Path object of the markdown file
-        root_path: Root directory path
-        
-    Returns:
-        String with Obsidian link format
-    """
-    # Get relative path from root
-    rel_path = file_path.relative_to(root_path)
-    
-    # File name without extension for display
-    display_name = file_path.stem
-    
-    # Create Obsidian wiki-link format: [[file_path|display_name]]
-    # For better compatibility, use the relative path without extension
-    link_path = str(rel_path.with_suffix(''))
-    
-    return f"[[{link_path}|{display_name}]]"
-
-
-def generate_index_content(md_files, root_path):
+def emit_index_content(out, md_files):
     """
-    Generate the content for the index.md file.
+    Write the body of the index.md file, everything after the header.
     
     Args:
-        md_files: Dictionary of directories and their markdown files
-        root_path: Root directory path
-        
-    Returns:
-        String with the complete index content
+        out: Writable text stream
+        md_files: Dictionary of directories and their sorted (display_name, link_path) tuples
     """
-    content = []
-    
-    # Header
-    content.append("# Obsidian Notes Index")
-    content.append("")
-    content.append(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-    content.append("")
+    w = out.write
     
     # Statistics
     total_files = sum(len(files) for files in md_files.values())
     total_dirs = len(md_files)
-    content.append("## Statistics")
-    content.append("")
-    content.append(f"- **Total Files**: {total_files}")
-    content.append(f"- **Total Directories**: {total_dirs}")
-    content.append("")
+    w("## Statistics\n\n")
+    w(f"- **Total Files**: {total_files}\n")
+    w(f"- **Total Directories**: {total_dirs}\n\n")
     
     # Table of Contents
-    content.append("## Table of Contents")
-    content.append("")
+    w("## Table of Contents\n\n")
     
-    # Sort directories (Root first, then alphabetically)
-    sorted_dirs = sorted(md_files.keys(), key=lambda x: (x != "Root", x.lower()))
+    # Sort directories (Root first, then alphabetically); the original name
+    # breaks ties between names differing only in case
+    sorted_dirs = [d for _, _, d in sorted((d != "Root", d.lower(), d) for d in md_files)]
     
     for directory in sorted_dirs:
-        files = md_files[directory]
         dir_display = "📁 Root Directory" if directory == "Root" else f"📁 {directory}"
-        content.append(f"- [{dir_display}](#{directory.lower().replace(' ', '-').replace('/', '-').replace('.', '')})")
+        w(f"- [{dir_display}](#{directory.lower().translate(_SLUG_TABLE)})\n")
     
-    content.append("")
-    content.append("---")
-    content.append("")
+    w("\n")
+    w("---\n\n")
     
     # File listings by directory
     for directory in sorted_dirs:
@@ -122,28 +88,19 @@ def generate_index_content(md_files, root_path):
         
         # Directory header
         dir_display = "Root Directory" if directory == "Root" else directory
-        content.append(f"## {dir_display}")
-        content.append("")
-        content.append(f"*{len(files)} file(s)*")
-        content.append("")
-        
-        # Sort files alphabetically
-        sorted_files = sorted(files, key=lambda x: x.name.lower())
+        w(f"## {dir_display}\n\n")
+        w(f"*{len(files)} file(s)*\n\n")
         
-        # List files
-        for file_path in sorted_files:
-            link = create_obsidian_link(file_path, root_path)
-            content.append(f"- {link}")
+        # List files as Obsidian wiki-links: [[link_path|display_name]];
+        # the scan already returns them in order
+        for display_name, link_path in files:
+            w(f"- [[{link_path}|{display_name}]]\n")
         
-        content.append("")
+        w("\n")
     
     # Footer
-    content.append("---")
-    content.append("")
-    content.append("*This index was automatically generated. To regenerate, run `python create_obsidian_index.py`*")
-    content.append("")
-    
-    return "\n".join(content)
+    w("---\n\n")
+    w("*This index was automatically generated. To regenerate, run `python create_obsidian_index.py`*\n")
 
 
 def main():
@@ -154,10 +111,15 @@ def main():
     else:
         root_dir = os.getcwd()
     
-    root_path = Path(root_dir).resolve()
+    root_path = os.path.realpath(root_dir)
+    
+    # Check if directory exists, with a single stat call
+    try:
+        is_dir = stat.S_ISDIR(os.stat(root_path).st_mode)
+    except OSError:
+        is_dir = False
     
-    # Check if directory exists
-    if not root_path.exists() or not root_path.is_dir():
+    if not is_dir:
         print(f"Error: Directory '{root_dir}' does not exist.")
         sys.exit(1)
     
@@ -170,14 +132,14 @@ def main():
         print("No markdown files found (excluding index.md).")
         sys.exit(0)
     
-    # Generate index content
+    # Stream the index into index.md
     print(f"Found {sum(len(files) for files in md_files.values())} markdown file(s) in {len(md_files)} director(y/ies).")
-    index_content = generate_index_content(md_files, root_path)
+    index_path = os.path.join(root_path, "index.md")
+    emit_body = functools.partial(emit_index_content, md_files=md_files)
     
-    # Write to index.md
-    index_path = root_path / "index.md"
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(index_content)
+    if not emit_index(index_path, "Obsidian Notes Index", emit_body):
+        print(f"✓ Index is up to date, no changes written: {index_path}")
+        return
     
     print(f"✓ Index created successfully: {index_path}")
 
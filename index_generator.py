@@ -6,40 +6,45 @@ This script scans the current directory and subdirectories for Python scripts
 and other files, then creates an index.md file with organized navigation links.
 """
 
+import functools
 import os
+import re
+import stat
 import sys
-from pathlib import Path
-from datetime import datetime
 
+from _emit import emit_index
+from _scan import walk_markdown
 
-def should_ignore(path, ignore_patterns=None):
-    """
-    Check if a path should be ignored based on common patterns.
-    
-    Args:
-        path: Path to check
-        ignore_patterns: Additional patterns to ignore
-    
-    Returns:
-        bool: True if path should be ignored
-    """
-    if ignore_patterns is None:
-        ignore_patterns = []
-    
-    default_ignores = [
-        '.git', '__pycache__', '.pytest_cache', 'venv', 'env',
-        '.vscode', '.idea', 'node_modules', '.DS_Store', 'index.md'
-    ]
-    
-    all_ignores = default_ignores + ignore_patterns
-    
-    # Check if any part of the path matches ignore patterns
-    parts = Path(path).parts
-    for part in parts:
-        if part in all_ignores or part.startswith('.'):
-            return True
-    
-    return False
+
+# Only the start of a Python file is read when looking for its docstring
+_DESCRIPTION_READ_SIZE = 4096
+
+# First triple-quoted string starting a line; an unterminated one (cut off by
+# the read limit) runs to the end of the text read
+_DOCSTRING_RE = re.compile(r'^[ \t]*[rRuU]?("""|\'\'\')(.*?)(?:\1|\Z)', re.DOTALL | re.MULTILINE)
+
+# Names of files and directories that are always skipped while scanning
+_IGNORED = frozenset([
+    '.git', '__pycache__', '.pytest_cache', 'venv', 'env',
+    '.vscode', '.idea', 'node_modules', '.DS_Store', 'index.md'
+])
+
+# Index category for each file suffix (without the leading dot); only
+# configuration and text files are included besides scripts and docs
+_CATEGORY_BY_SUFFIX = {
+    'py': 'python_scripts',
+    'md': 'markdown_files',
+    'txt': 'other_files',
+    'json': 'other_files',
+    'yaml': 'other_files',
+    'yml': 'other_files',
+    'toml': 'other_files',
+    'cfg': 'other_files',
+    'ini': 'other_files',
+}
+
+# File name suffixes picked up by the scan, for a single str.endswith() check
+_SCAN_SUFFIXES = tuple('.' + suffix for suffix in _CATEGORY_BY_SUFFIX)
 
 
 def scan_directory(root_dir='.'):
@@ -52,39 +57,55 @@ def scan_directory(root_dir='.'):
     Returns:
         dict: Dictionary with categorized files
     """
-    root_path = Path(root_dir).resolve()
-    
     files_by_type = {
         'python_scripts': [],
         'markdown_files': [],
         'other_files': []
     }
     
-    for item in root_path.rglob('*'):
-        if item.is_file():
-            rel_path = item.relative_to(root_path)
-            
-            # Skip ignored files
-            if should_ignore(rel_path):
-                continue
-            
-            # Categorize files
-            if item.suffix == '.py':
-                files_by_type['python_scripts'].append(rel_path)
-            elif item.suffix == '.md':
-                files_by_type['markdown_files'].append(rel_path)
-            else:
-                # Only include configuration and text files
-                if item.suffix in ['.txt', '.json', '.yaml', '.yml', '.toml', '.cfg', '.ini']:
-                    files_by_type['other_files'].append(rel_path)
+    # One pass buckets every category by the suffix that matched
+    for rel_dir, name in walk_markdown(
+        root_dir, ignored=_IGNORED, suffixes=_SCAN_SUFFIXES, skip_hidden=True
+    ):
+        category = _CATEGORY_BY_SUFFIX[name.rpartition('.')[2]]
+        files_by_type[category].append(os.path.join(rel_dir, name))
     
-    # Sort all lists
+    # Sort all lists (component-wise, matching path ordering)
     for key in files_by_type:
-        files_by_type[key].sort()
+        files_by_type[key].sort(key=lambda p: p.split(os.sep))
     
     return files_by_type
 
 
+@functools.lru_cache(maxsize=2048)
+def _read_description(path, mtime_ns, size):
+    """
+    Read the docstring summary of a Python file.
+    
+    Cached on the file's modification time and size, so unchanged files are
+    only read once per process.
+    
+    Args:
+        path: Path to the Python file as a string
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+    
+    Returns:
+        str: First non-empty docstring line or empty string
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        head = f.read(_DESCRIPTION_READ_SIZE)
+    
+    match = _DOCSTRING_RE.search(head)
+    if match:
+        for line in match.group(2).splitlines():
+            stripped = line.strip()
+            if stripped:
+                return stripped
+    
+    return ""
+
+
 def get_file_description(file_path):
     """
     Try to extract description from file (first line of docstring for Python files).
@@ -96,104 +117,94 @@ def get_file_description(file_path):
         str: Description or empty string
     """
     try:
-        if file_path.suffix == '.py':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                in_docstring = False
-                for line in lines:
-                    stripped = line.strip()
-                    if '"""' in stripped or "'''" in stripped:
-                        if not in_docstring:
-                            in_docstring = True
-                            # Check if docstring is on same line
-                            content = stripped.strip('"""').strip("'''").strip()
-                            if content:
-                                return content
-                        else:
-                            # End of docstring
-                            break
-                    elif in_docstring:
-                        if stripped:
-                            return stripped
+        if os.fspath(file_path).endswith('.py'):
+            st = os.stat(file_path)
+            return _read_description(os.fspath(file_path), st.st_mtime_ns, st.st_size)
     except Exception:
         pass
     
     return ""
 
 
-def generate_index(root_dir='.', output_file='index.md'):
+def emit_index_content(out, root_path, files_by_type):
     """
-    Generate index.md file with navigation links.
+    Write the body of the index file, everything after the header.
     
     Args:
-        root_dir: Root directory to scan
-        output_file: Output file name
+        out: Writable text stream
+        root_path: Root directory path
+        files_by_type: Dictionary with categorized files
     """
-    root_path = Path(root_dir).resolve()
-    output_path = root_path / output_file
-    
-    print(f"Scanning directory: {root_path}")
-    files_by_type = scan_directory(root_dir)
+    w = out.write
     
-    # Generate markdown content
-    content = []
-    content.append("# Utility Tools Index")
-    content.append("")
-    content.append(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-    content.append("")
-    content.append("This index provides easy navigation to all utility tools in this repository.")
-    content.append("")
+    w("This index provides easy navigation to all utility tools in this repository.\n\n")
     
     # Python Scripts section
     if files_by_type['python_scripts']:
-        content.append("## Python Scripts")
-        content.append("")
+        w("## Python Scripts\n\n")
         for script in files_by_type['python_scripts']:
-            description = get_file_description(root_path / script)
+            description = get_file_description(os.path.join(root_path, script))
             if description:
-                content.append(f"- [{script}]({script}) - {description}")
+                w(f"- [{script}]({script}) - {description}\n")
             else:
-                content.append(f"- [{script}]({script})")
-        content.append("")
+                w(f"- [{script}]({script})\n")
+        w("\n")
     
     # Markdown Files section
     if files_by_type['markdown_files']:
-        content.append("## Documentation")
-        content.append("")
+        w("## Documentation\n\n")
         for md_file in files_by_type['markdown_files']:
-            content.append(f"- [{md_file}]({md_file})")
-        content.append("")
+            w(f"- [{md_file}]({md_file})\n")
+        w("\n")
     
     # Other Files section
     if files_by_type['other_files']:
-        content.append("## Configuration Files")
-        content.append("")
+        w("## Configuration Files\n\n")
         for other_file in files_by_type['other_files']:
-            content.append(f"- [{other_file}]({other_file})")
-        content.append("")
+            w(f"- [{other_file}]({other_file})\n")
+        w("\n")
     
     # Usage section
-    content.append("---")
-    content.append("")
-    content.append("## How to Use")
-    content.append("")
-    content.append("Each tool in this repository is designed to be self-contained and easy to use.")
-    content.append("Check individual tool documentation for specific usage instructions.")
-    content.append("")
-    content.append("### Regenerating This Index")
-    content.append("")
-    content.append("To regenerate this index after adding new tools:")
-    content.append("")
-    content.append("```bash")
-    content.append("python index_generator.py")
-    content.append("```")
-    content.append("")
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(content))
-    
-    print(f"✓ Index generated successfully: {output_path}")
+    w("---\n\n")
+    w("## How to Use\n\n")
+    w("Each tool in this repository is designed to be self-contained and easy to use.\n")
+    w("Check individual tool documentation for specific usage instructions.\n\n")
+    w("### Regenerating This Index\n\n")
+    w("To regenerate this index after adding new tools:\n\n")
+    w("```bash\n")
+    w("python index_generator.py\n")
+    w("```\n")
+
+
+def generate_index(root_dir='.', output_file='index.md'):
+    """
+    Generate index.md file with navigation links.
+    
+    Args:
+        root_dir: Root directory to scan
+        output_file: Output file name
+    """
+    root_path = os.path.realpath(root_dir)
+    output_path = os.path.join(root_path, output_file)
+    
+    # Check if directory exists, with a single stat call
+    try:
+        mode = os.stat(root_path).st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Directory '{root_dir}' does not exist.") from None
+    
+    if not stat.S_ISDIR(mode):
+        raise NotADirectoryError(f"'{root_dir}' is not a directory.")
+    
+    print(f"Scanning directory: {root_path}")
+    files_by_type = scan_directory(root_path)
+    
+    # Stream the index into the output file
+    emit_body = functools.partial(emit_index_content, root_path=root_path, files_by_type=files_by_type)
+    if emit_index(output_path, "Utility Tools Index", emit_body):
+        print(f"✓ Index generated successfully: {output_path}")
+    else:
+        print(f"✓ Index is up to date, no changes written: {output_path}")
     print(f"  - {len(files_by_type['python_scripts'])} Python scripts")
     print(f"  - {len(files_by_type['markdown_files'])} Markdown files")
     print(f"  - {len(files_by_type['other_files'])} Configuration files")